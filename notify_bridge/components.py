@@ -9,6 +9,7 @@ from abc import ABC, abstractmethod
 from typing import Any, ClassVar, Dict, Optional, Type, Union
 
 # Import third-party modules
+import httpx
 from pydantic import ValidationError
 
 # Import local modules
@@ -155,6 +156,22 @@ class BaseNotifier(AbstractNotifier):
         self._config = config or HTTPClientConfig()
         self._sync_client: Optional[HTTPClient] = None
         self._async_client: Optional[AsyncHTTPClient] = None
+        self._external_sync_client: Optional[httpx.Client] = None
+        self._external_async_client: Optional[httpx.AsyncClient] = None
+
+    def use_http_clients(
+        self, sync_client: Optional[httpx.Client] = None, async_client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """Send requests through pre-built httpx clients instead of creating new ones.
+
+        The clients are not closed when the notifier is closed.
+
+        Args:
+            sync_client: Client used for sync requests.
+            async_client: Client used for async requests.
+        """
+        self._external_sync_client = sync_client
+        self._external_async_client = async_client
 
     def _ensure_sync_client(self) -> HTTPClient:
         """Ensure sync client is initialized.
@@ -163,7 +180,7 @@ class BaseNotifier(AbstractNotifier):
             HTTPClient: HTTP client instance.
         """
         if self._sync_client is None:
-            self._sync_client = HTTPClient(self._config)
+            self._sync_client = HTTPClient(self._config, client=self._external_sync_client)
         return self._sync_client
 
     async def _ensure_async_client(self) -> AsyncHTTPClient:
@@ -173,7 +190,7 @@ class BaseNotifier(AbstractNotifier):
             AsyncHTTPClient: Async HTTP client instance.
         """
         if self._async_client is None:
-            self._async_client = AsyncHTTPClient(self._config)
+            self._async_client = AsyncHTTPClient(self._config, client=self._external_async_client)
         return self._async_client
 
     def close(self) -> None:
@@ -28,11 +28,22 @@ class NotifyBridge:
     through different notifiers.
     """
 
-    def __init__(self, config: Optional[HTTPClientConfig] = None) -> None:
+    def __init__(
+        self,
+        config: Optional[HTTPClientConfig] = None,
+        factory: Optional[NotifierFactory] = None,
+        sync_client: Optional[httpx.Client] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
         """Initialize NotifyBridge.
 
         Args:
             config: HTTP client configuration
+            factory: Notifier factory to use, a new one is created if not provided
+            sync_client: Pre-built client used by the context manager and the notifiers instead of creating one,
+                it is never closed by the bridge
+            async_client: Pre-built async client used by the async context manager and the notifiers,
+                it is never closed by the bridge
 
         Raises:
             ConfigurationError: If config is invalid
@@ -43,39 +54,47 @@ class NotifyBridge:
             self._config = config
         else:
             raise ConfigurationError("Invalid configuration. Expected HTTPClientConfig or None.", config_value=config)
-        self._factory = NotifierFactory()
+        self._factory = factory if factory is not None else NotifierFactory()
+        self._external_sync_client = sync_client
+        self._external_async_client = async_client
         self._sync_client: Optional[httpx.Client] = None
         self._async_client: Optional[httpx.AsyncClient] = None
         self._notifiers: Dict[str, BaseNotifier] = {}
 
     def __enter__(self) -> "NotifyBridge":
         """Enter context manager."""
-        self._sync_client = httpx.Client(
-            timeout=self._config.timeout, verify=self._config.verify_ssl, headers=self._config.headers
-        )
+        if self._external_sync_client is not None:
+            self._sync_client = self._external_sync_client
+        else:
+            self._sync_client = httpx.Client(
+                timeout=self._config.timeout, verify=self._config.verify_ssl, headers=self._config.headers
+            )
         return self
 
     def __exit__(
         self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[Any]
     ) -> None:
         """Exit context manager."""
-        if self._sync_client:
+        if self._sync_client and self._sync_client is not self._external_sync_client:
             self._sync_client.close()
         self._sync_client = None
         self._cleanup_notifiers_sync()
 
     async def __aenter__(self) -> "NotifyBridge":
         """Enter async context manager."""
-        self._async_client = httpx.AsyncClient(
-            timeout=self._config.timeout, verify=self._config.verify_ssl, headers=self._config.headers
-        )
+        if self._external_async_client is not None:
+            self._async_client = self._external_async_client
+        else:
+            self._async_client = httpx.AsyncClient(
+                timeout=self._config.timeout, verify=self._config.verify_ssl, headers=self._config.headers
+            )
         return self
 
     async def __aexit__(
         self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[Any]
     ) -> None:
         """Exit async context manager."""
-        if self._async_client:
+        if self._async_client and self._async_client is not self._external_async_client:
             await self._async_client.aclose()
         self._async_client = None
         await self._cleanup_notifiers_async()
@@ -92,6 +111,19 @@ class NotifyBridge:
             await notifier.close_async()
         self._notifiers.clear()
 
+    def _build_notifier(self, notifier_class: Type[BaseNotifier]) -> BaseNotifier:
+        """Instantiate a notifier wired to the bridge's config and injected clients.
+
+        Args:
+            notifier_class: Notifier class
+
+        Returns:
+            BaseNotifier: Notifier instance
+        """
+        notifier = notifier_class(config=self._config)
+        notifier.use_http_clients(self._external_sync_client, self._external_async_client)
+        return notifier
+
     def get_notifier_class(self, name: str) -> Type[BaseNotifier]:
         """Get notifier class by name.
 
@@ -124,8 +156,7 @@ class NotifyBridge:
         Raises:
             NoSuchNotifierError: If notifier is not found
         """
-        notifier_class = self.get_notifier_class(name)
-        return notifier_class(config=self._config)
+        return self._build_notifier(self.get_notifier_class(name))
 
     def register_notifier(self, name: str, notifier_class: Type[BaseNotifier]) -> None:
         """Register a notifier.
@@ -137,7 +168,7 @@ class NotifyBridge:
         if not isinstance(notifier_class, type) or not issubclass(notifier_class, BaseNotifier):
             raise ValueError("notifier_class must be a subclass of BaseNotifier")
         self._factory.register_notifier(name, notifier_class)
-        self._notifiers[name] = notifier_class(config=self._config)
+        self._notifiers[name] = self._build_notifier(notifier_class)
 
     def get_registered_notifiers(self) -> Dict[str, Type[BaseNotifier]]:
         """Get registered notifiers.
@@ -172,7 +203,7 @@ class NotifyBridge:
             notifier_class = self._factory.get_notifier_class(name)
             if notifier_class is None:
                 raise NoSuchNotifierError(f"Notifier {name} not found")
-            self._notifiers[name] = notifier_class(config=self._config)
+            self._notifiers[name] = self._build_notifier(notifier_class)
         return self._notifiers[name]
 
     def send(
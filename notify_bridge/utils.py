@@ -90,18 +90,23 @@ class HTTPClientConfig(BaseModel):
 class HTTPClient:
     """HTTP client wrapper."""
 
-    def __init__(self, config: HTTPClientConfig) -> None:
+    def __init__(self, config: HTTPClientConfig, client: Optional[httpx.Client] = None) -> None:
         """Initialize client.
 
         Args:
             config: HTTP client configuration
+            client: Optional pre-built httpx client to use instead of creating one;
+                it is not closed by this wrapper
         """
         self._config = config
-        self._client = httpx.Client(
-            timeout=config.timeout,
-            verify=config.verify_ssl,
-            headers=config.headers,
-        )
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.Client(
+                timeout=config.timeout,
+                verify=config.verify_ssl,
+                headers=config.headers,
+            )
+        self._client = client
 
     def __enter__(self) -> "HTTPClient":
         """Enter context manager.
@@ -177,24 +182,30 @@ class HTTPClient:
 
     def close(self) -> None:
         """Close client."""
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
 
 
 class AsyncHTTPClient:
     """Async HTTP client wrapper."""
 
-    def __init__(self, config: HTTPClientConfig) -> None:
+    def __init__(self, config: HTTPClientConfig, client: Optional[httpx.AsyncClient] = None) -> None:
         """Initialize client.
 
         Args:
             config: HTTP client configuration
+            client: Optional pre-built httpx client to use instead of creating one;
+                it is not closed by this wrapper
         """
         self._config = config
-        self._client = httpx.AsyncClient(
-            timeout=config.timeout,
-            verify=config.verify_ssl,
-            headers=config.headers,
-        )
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=config.timeout,
+                verify=config.verify_ssl,
+                headers=config.headers,
+            )
+        self._client = client
 
     async def __aenter__(self) -> "AsyncHTTPClient":
         """Enter async context manager.
@@ -270,4 +281,5 @@ class AsyncHTTPClient:
 
     async def close(self) -> None:
         """Close client."""
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
@@ -34,10 +34,11 @@ def pytest(session: nox.Session) -> None:
     - Run all tests: nox -s pytest
     - Run specific test file: nox -s pytest -- tests/notify_bridge/test_core.py
     - Run with verbose output: nox -s pytest -- -v
+    - Run in parallel across CPU cores: nox -s pytest -- -n auto --dist loadgroup
     - Combine options: nox -s pytest -- tests/notify_bridge/test_core.py -v -k "test_specific_function"
     """
     session.install(".")
-    session.install("pytest", "pytest-cov", "pytest-mock", "pytest-asyncio")
+    session.install("pytest", "pytest-cov", "pytest-mock", "pytest-asyncio", "pytest-xdist")
     test_root = THIS_ROOT / "tests"
 
     # Print debug information
@@ -1,60 +1,90 @@
 """Test fixtures and utilities for notify-bridge tests."""
 
 # Import built-in modules
-from typing import Any, Dict
-from unittest.mock import Mock
+from typing import Any, Dict, Optional
 
 # Import third-party modules
 import httpx
 import pytest
+import pytest_asyncio
 
 # Import local modules
 from notify_bridge.components import BaseNotifier, NotificationSchema
+from notify_bridge.exceptions import NotificationError
+from notify_bridge.factory import NotifierFactory
 from notify_bridge.utils import HTTPClientConfig
 
+_JSON_BYTES = b'{"success": true}'
+_JSON_HEADERS = [(b"content-type", b"application/json")]
 
-class MockResponse:
-    """Mock HTTP response."""
 
-    def __init__(self, status_code: int = 200, json_data: Dict[str, Any] = None):
-        """Initialize mock response.
+class _FastTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport answering every request with a pre-serialized successful JSON response."""
 
-        Args:
-            status_code: HTTP status code
-            json_data: JSON response data
-        """
-        self.status_code = status_code
-        self._json_data = json_data or {}
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a sync request."""
+        return httpx.Response(200, content=_JSON_BYTES, headers=_JSON_HEADERS)
 
-    def json(self) -> Dict[str, Any]:
-        """Get JSON response data."""
-        return self._json_data
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer an async request."""
+        return httpx.Response(200, content=_JSON_BYTES, headers=_JSON_HEADERS)
 
-    def raise_for_status(self):
-        """Raise an exception if status code indicates an error."""
-        if self.status_code >= 400:
-            raise httpx.HTTPStatusError("Mock HTTP error", request=Mock(), response=Mock(status_code=self.status_code))
 
+_FAST_TRANSPORT = _FastTransport()
 
-@pytest.fixture
-def mock_response() -> MockResponse:
-    """Fixture for mock HTTP response."""
-    return MockResponse(status_code=200, json_data={"status": "success"})
 
+@pytest.fixture(scope="session")
+def mock_transport() -> _FastTransport:
+    """Fixture for a mock transport serving both sync and async clients."""
+    return _FAST_TRANSPORT
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def mock_transport_client(mock_transport: _FastTransport) -> httpx.Client:
+    """Fixture for a sync client backed by the mock transport."""
+    client = httpx.Client(transport=mock_transport)
+    yield client
+    client.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def mock_transport_async_client(mock_transport: _FastTransport) -> httpx.AsyncClient:
+    """Fixture for an async client backed by the mock transport."""
+    async with httpx.AsyncClient(transport=mock_transport) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
 def http_client_config() -> HTTPClientConfig:
     """Fixture for HTTP client configuration."""
     return HTTPClientConfig(timeout=5.0, max_retries=1, retry_delay=0.1, verify_ssl=False)
 
 
-class TestNotifier(BaseNotifier):
-    """Test notifier implementation."""
+class SharedTestSchema(NotificationSchema):
+    """Test data schema shared by the test modules."""
+
+    model_config = {"extra": "allow"}
+
+
+class SharedTestNotifier(BaseNotifier):
+    """Test notifier shared by the test modules."""
 
     name = "test"
+    schema = SharedTestSchema
+
+    def __init__(self, config: HTTPClientConfig = None, **kwargs: Any) -> None:
+        """Initialize test notifier.
+
+        Args:
+            config: HTTP client configuration.
+            **kwargs: Additional arguments.
+        """
+        super().__init__(config)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     def assemble_data(self, data: NotificationSchema) -> Dict[str, Any]:
-        """Build data payload.
+        """Build payload for data.
 
         Args:
             data: Notification data.
@@ -62,10 +92,124 @@ class TestNotifier(BaseNotifier):
         Returns:
             Dict[str, Any]: API payload.
         """
-        return {"message": data.content, "title": data.title}
+        return {"url": data.webhook_url, "json": {"content": data.content, "title": data.title}}
+
+    def send(self, notification: NotificationSchema) -> Dict[str, Any]:
+        """Send data.
+
+        Args:
+            notification: Notification data.
+
+        Returns:
+            Dict[str, Any]: Response data.
+        """
+        return {"success": True, "name": "test", "message": "Notification sent successfully", "data": {"success": True}}
+
+    async def send_async(self, notification: NotificationSchema) -> Dict[str, Any]:
+        """Send data asynchronously.
+
+        Args:
+            notification: Notification data.
+
+        Returns:
+            Dict[str, Any]: Response data.
+        """
+        return {"success": True, "name": "test", "message": "Notification sent successfully", "data": {"success": True}}
+
+    def notify(self, notification: Dict[str, Any]) -> Dict[str, Any]:
+        """Send data synchronously.
+
+        Args:
+            notification: Notification data.
+
+        Returns:
+            Dict[str, Any]: Response data.
+
+        Raises:
+            NotificationError: If data validation fails.
+        """
+        if isinstance(notification, dict):
+            try:
+                notification = self.schema(**notification)
+            except Exception as e:
+                raise NotificationError(str(e))
+        return self.send(notification)
+
+    async def notify_async(self, notification: Dict[str, Any]) -> Dict[str, Any]:
+        """Send data asynchronously.
+
+        Args:
+            notification: Notification data.
+
+        Returns:
+            Dict[str, Any]: Response data.
+
+        Raises:
+            NotificationError: If data validation fails.
+        """
+        if isinstance(notification, dict):
+            try:
+                notification = self.schema(**notification)
+            except Exception as e:
+                raise NotificationError(str(e))
+        return await self.send_async(notification)
+
+
+@pytest.fixture(scope="session")
+def shared_factory() -> NotifierFactory:
+    """Create a NotifierFactory with the test notifier registered."""
+    factory = NotifierFactory()
+    factory.register_notifier("test", SharedTestNotifier)
+    return factory
+
+
+@pytest.fixture
+def factory(shared_factory: NotifierFactory) -> NotifierFactory:
+    """Provide the shared factory and restore its registry after each test."""
+    snapshot = shared_factory.get_notifier_names()
+    yield shared_factory
+    shared_factory._notifiers.clear()
+    shared_factory._notifiers.update(snapshot)
 
 
 @pytest.fixture
-def test_notifier(http_client_config: HTTPClientConfig) -> TestNotifier:
-    """Fixture for test notifier class."""
-    return TestNotifier(http_client_config)
+def test_data() -> Dict[str, Any]:
+    """Create test data fixture."""
+    return {"webhook_url": "https://example.com", "title": "Test Title", "content": "Test Content", "msg_type": "text"}
+
+
+class MockSchema(NotificationSchema):
+    """Mock schema for testing."""
+
+    content: str
+    title: str
+    msg_type: str = "text"
+    webhook_url: str
+    method: str = "POST"
+    headers: Dict[str, str] = {}
+    timeout: Optional[float] = None
+    verify_ssl: bool = True
+
+
+class MockNotifier(BaseNotifier):
+    """Mock notifier for testing."""
+
+    name = "mock"
+    schema_class = MockSchema
+
+    def assemble_data(self, data: MockSchema) -> Dict[str, Any]:
+        """Assemble data.
+
+        Args:
+            data: Notification data.
+
+        Returns:
+            Dict[str, Any]: API payload.
+        """
+        if isinstance(data, dict):
+            return {
+                "text": data.get("content", ""),
+                "title": data.get("title", ""),
+                "msg_type": data.get("msg_type", "text"),
+            }
+        return {"text": data.content, "title": data.title, "msg_type": data.msg_type}
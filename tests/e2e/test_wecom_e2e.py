@@ -71,7 +71,6 @@ class TestWeComTextMessage:
         assert response.success is True
         assert response.data.get("errcode") == 0
 
-    @pytest.mark.asyncio
     async def test_send_text_message_async(self, bridge: NotifyBridge, webhook_url: str) -> None:
         """Test sending a text message asynchronously."""
         response = await bridge.send_async(
@@ -133,7 +132,6 @@ This message mentions @all users.
         assert response.success is True
         assert response.data.get("errcode") == 0
 
-    @pytest.mark.asyncio
     async def test_send_markdown_message_async(self, bridge: NotifyBridge, webhook_url: str) -> None:
         """Test sending a markdown message asynchronously."""
         content = f"""# E2E Test - Async Markdown
@@ -223,7 +221,6 @@ This message mentions @all users using markdown_v2 format.
         assert response.success is True
         assert response.data.get("errcode") == 0
 
-    @pytest.mark.asyncio
     async def test_send_markdown_v2_message_async(self, bridge: NotifyBridge, webhook_url: str) -> None:
         """Test sending a markdown_v2 message asynchronously."""
         content = f"""# E2E Test - Async Markdown V2
@@ -286,7 +283,6 @@ class TestWeComNewsMessage:
         assert response.success is True
         assert response.data.get("errcode") == 0
 
-    @pytest.mark.asyncio
     async def test_send_news_message_async(self, bridge: NotifyBridge, webhook_url: str) -> None:
         """Test sending a news message asynchronously."""
         response = await bridge.send_async(
@@ -385,7 +381,6 @@ class TestWeComTemplateCardMessage:
         assert response.success is True
         assert response.data.get("errcode") == 0
 
-    @pytest.mark.asyncio
     async def test_send_template_card_async(self, bridge: NotifyBridge, webhook_url: str) -> None:
         """Test sending a template card asynchronously."""
         response = await bridge.send_async(
@@ -456,7 +451,6 @@ class TestWeComDirectNotifier:
         assert response.success is True
         assert response.data.get("errcode") == 0
 
-    @pytest.mark.asyncio
     async def test_direct_notifier_async(self, notifier: WeComNotifier, webhook_url: str) -> None:
         """Test sending message asynchronously using notifier directly."""
         response = await notifier.send_async(
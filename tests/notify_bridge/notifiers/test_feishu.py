@@ -111,9 +111,8 @@ def test_build_file_payload(tmp_path: Path):
     )
 
     # Test file upload not implemented
-    with pytest.raises(NotificationError) as exc_info:
+    with pytest.raises(NotificationError, match="File upload not implemented yet"):
         notifier.assemble_data(notification)
-    assert "File upload not implemented yet" in str(exc_info.value)
 
     # Test without file_path
     notification = FeishuSchema(webhook_url="https://test.url", msg_type=MessageType.FILE, token="test_token")
@@ -229,6 +228,5 @@ def test_unsupported_message_type():
 
     # Create a data with unsupported message type
     notification = FeishuSchema(webhook_url="https://test.url", msg_type="markdown")  # Not in supported_types
-    with pytest.raises(NotificationError) as exc_info:
+    with pytest.raises(NotificationError, match="Unsupported message type: markdown"):
         notifier.assemble_data(notification)
-    assert "Unsupported message type: markdown" in str(exc_info.value)
@@ -1,208 +1,100 @@
 """Tests for core functionality."""
 
 # Import built-in modules
-from typing import Any, Dict, Optional, Type
-from unittest.mock import AsyncMock, patch
+from typing import Any, Dict, Type
+from unittest.mock import Mock
 
 # Import third-party modules
 import httpx
 import pytest
+import pytest_asyncio
 
 # Import local modules
 from notify_bridge.components import BaseNotifier
 from notify_bridge.core import NotifyBridge
 from notify_bridge.exceptions import NoSuchNotifierError, NotificationError
-from notify_bridge.schema import NotificationResponse, NotificationSchema
+from notify_bridge.factory import NotifierFactory
+from notify_bridge.schema import NotificationResponse
 from notify_bridge.utils import HTTPClientConfig
 
+from tests.conftest import MockNotifier
 
-class MockSchema(NotificationSchema):
-    """Mock schema for testing."""
+_OK_PAYLOAD = NotificationResponse(
+    success=True, name="", message="Notification sent successfully", data={}
+).model_dump()
 
-    content: str
-    title: str
-    msg_type: str = "text"
-    webhook_url: str
-    method: str = "POST"
-    headers: Dict[str, str] = {}
-    timeout: Optional[float] = None
-    verify_ssl: bool = True
 
+def _build_mock_factory() -> Mock:
+    """Build the mock NotifierFactory class used by the mock_factory fixture."""
+    notifier = MockNotifier()
+    mock = Mock()
+    mock_instance = mock.return_value
+    mock_instance.get_notifier_class.return_value = MockNotifier
+    mock_instance.create_notifier.return_value = notifier
+    mock_instance.send.side_effect = lambda notifier_name, data: {**_OK_PAYLOAD, "name": notifier_name}
 
-class MockNotifier(BaseNotifier):
-    """Mock notifier for testing."""
+    async def _create_notifier_async(*args: Any, **kwargs: Any) -> MockNotifier:
+        return notifier
 
-    name = "mock"
-    schema_class = MockSchema
-
-    def assemble_data(self, data: MockSchema) -> Dict[str, Any]:
-        """Assemble data.
-
-        Args:
-            data: Notification data.
-
-        Returns:
-            Dict[str, Any]: API payload.
-        """
-        if isinstance(data, dict):
-            return {
-                "text": data.get("content", ""),
-                "title": data.get("title", ""),
-                "msg_type": data.get("msg_type", "text"),
-            }
-        return {"text": data.content, "title": data.title, "msg_type": data.msg_type}
-
-    def prepare_request_params(self, notification: NotificationSchema, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare request parameters.
-
-        Args:
-            notification: Notification data.
-            payload: Prepared payload.
-
-        Returns:
-            Dict[str, Any]: Request parameters.
-        """
-        return {
-            "method": "POST",
-            "url": notification.webhook_url,
-            "json": payload,
-            "headers": notification.headers,
-        }
-
-    def send_notification(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Send data."""
-        notification = self.validate(data)
-        self._ensure_sync_client()
-        response = self._http_client.request(
-            method=self.get_http_method(),
-            url=notification.webhook_url,
-            headers=notification.headers,
-            json=self.assemble_data(notification),
-            timeout=self._config.timeout,
-        )
-        return NotificationResponse(
-            success=response.status_code == 200, name=self.name, message="Notification sent successfully", data=response
-        ).model_dump()
-
-    async def send_notification_async(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Send data asynchronously."""
-        notification = self.validate(data)
-        response = await self._async_http_client.request(
-            method=notification.method,
-            url=notification.webhook_url,
-            headers=notification.headers,
-            json=self.assemble_data(notification),
-            timeout=notification.timeout,
-            verify=notification.verify_ssl,
-        )
-        return NotificationResponse(
-            success=True,
-            name=self.name,
-            message="Notification sent successfully",
-            data=response.json() if response.text else None,
-        ).model_dump()
+    async def _send_async(notifier_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {**_OK_PAYLOAD, "name": notifier_name}
 
+    mock_instance.create_notifier_async = _create_notifier_async
+    mock_instance.send_async = _send_async
+    mock_instance.get_notifier_names.return_value = {"mock": MockNotifier}
+    return mock
 
-@pytest.fixture
-def mock_factory():
-    """Create a mock factory."""
-    with patch("notify_bridge.core.NotifierFactory") as mock:
-        mock_instance = mock.return_value
-        mock_instance.get_notifier_class.return_value = MockNotifier
-        mock_instance.create_notifier.return_value = MockNotifier()
-        mock_instance.create_notifier_async = AsyncMock(return_value=MockNotifier())
-        mock_instance.send.side_effect = lambda notifier_name, data: NotificationResponse(
-            success=True, name=notifier_name, message="Notification sent successfully", data={}
-        ).model_dump()
-        mock_instance.send_async = AsyncMock(
-            side_effect=lambda notifier_name, data: NotificationResponse(
-                success=True, name=notifier_name, message="Notification sent successfully", data={}
-            ).model_dump()
-        )
-        mock_instance.get_notifier_names.return_value = {"mock": MockNotifier}
-        yield mock_instance
 
+_MOCK_FACTORY = _build_mock_factory()
 
-@pytest.fixture
-def test_data() -> Dict[str, Any]:
-    """Test data fixture."""
-    return {
-        "webhook_url": "https://example.com",
-        "title": "test title",
-        "content": "test content",
-        "msg_type": "text",
-    }
+
+class MockHTTPNotifier(BaseNotifier):
+    """Notifier registered by the core tests, relying on BaseNotifier's validation and send path."""
+
+    name = "mock"
 
 
 @pytest.fixture
+def mock_factory(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Install the prebuilt mock factory."""
+    monkeypatch.setattr("notify_bridge.core.NotifierFactory", _MOCK_FACTORY)
+    return _MOCK_FACTORY.return_value
+
+
+@pytest.fixture(scope="module")
 def test_notifier() -> Type[BaseNotifier]:
     """Test notifier fixture."""
+    return MockHTTPNotifier
 
-    class TestNotifier(BaseNotifier):
-        """Test notifier."""
-
-        name = "mock"
-
-        def get_http_method(self) -> str:
-            """Get HTTP method.
-
-            Returns:
-                str: HTTP method.
-            """
-            return "POST"
-
-        def assemble_data(self, notification: NotificationSchema) -> Dict[str, Any]:
-            """Assemble notification data.
-
-            Args:
-                notification: Notification data.
-
-            Returns:
-                Dict[str, Any]: Assembled data.
-            """
-            payload = {
-                "msg_type": notification.msg_type,
-                "text": notification.content,
-                "title": notification.title,
-            }
-            return {
-                "method": "POST",
-                "url": notification.url,
-                "json": payload,
-            }
-
-        def send(self, data: Dict[str, Any]) -> Dict[str, Any]:
-            """Send notification.
-
-            Args:
-                data: Notification data.
-
-            Returns:
-                Dict[str, Any]: Response data.
-            """
-            notification = self.validate(data)
-            self._ensure_sync_client()
-            response = self._http_client.request(
-                method=self.get_http_method(),
-                url=notification.url,
-                headers=notification.headers,
-                json=self.assemble_data(notification),
-                timeout=self._config.timeout,
-            )
-            return NotificationResponse(
-                success=response.status_code == 200,
-                name=self.name,
-                message="Notification sent successfully",
-                data=response.json() if response.text else None,
-            ).model_dump()
-
-    return TestNotifier
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def notify_bridge() -> NotifyBridge:
-    """NotifyBridge fixture."""
-    return NotifyBridge()
+    """NotifyBridge fixture with its own factory."""
+    bridge = NotifyBridge(factory=NotifierFactory())
+    yield bridge
+    bridge.close()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _register_test_notifier(notify_bridge: NotifyBridge, test_notifier: Type[BaseNotifier]) -> None:
+    """Register the test notifier once for the whole module."""
+    notify_bridge.register_notifier("test", test_notifier)
+    yield
+    notify_bridge._factory.unregister_notifier("test")
+
+
+@pytest.fixture(scope="module")
+def entered_bridge() -> NotifyBridge:
+    """NotifyBridge entered as a sync context manager."""
+    with NotifyBridge() as bridge:
+        yield bridge
+
+
+@pytest_asyncio.fixture(scope="module")
+async def entered_async_bridge() -> NotifyBridge:
+    """NotifyBridge entered as an async context manager."""
+    async with NotifyBridge() as bridge:
+        yield bridge
 
 
 def test_init():
@@ -215,23 +107,72 @@ def test_init():
     assert bridge._config == config
 
 
-def test_context_manager():
-    """Test context manager."""
+def test_context_manager_opens(entered_bridge: NotifyBridge):
+    """Test context manager opens a sync client."""
+    assert isinstance(entered_bridge._sync_client, httpx.Client)
+    assert entered_bridge._async_client is None
+
+
+def test_context_manager_closes(mock_transport_client: httpx.Client):
+    """Test context manager releases an injected sync client on exit without closing it."""
+    with NotifyBridge(sync_client=mock_transport_client) as bridge:
+        assert bridge._sync_client is mock_transport_client
+
+    assert bridge._sync_client is None
+    assert not mock_transport_client.is_closed
+
+
+def test_context_manager_closes_own_client():
+    """Test context manager closes the sync client it created on exit."""
     with NotifyBridge() as bridge:
-        assert isinstance(bridge._sync_client, httpx.Client)
-        assert bridge._async_client is None
+        client = bridge._sync_client
 
     assert bridge._sync_client is None
+    assert client.is_closed
+
+
+def test_send_uses_injected_client(mock_transport_client: httpx.Client):
+    """Test notifiers send through the sync client injected into the bridge and leave it open."""
+    bridge = NotifyBridge(sync_client=mock_transport_client)
+    response = bridge.send("feishu", webhook_url="https://example.com", content="Test Content")
+    bridge.close()
+
+    assert response.data == {"success": True}
+    assert not mock_transport_client.is_closed
+
 
+async def test_async_context_manager_opens(entered_async_bridge: NotifyBridge):
+    """Test async context manager opens an async client."""
+    assert isinstance(entered_async_bridge._async_client, httpx.AsyncClient)
+    assert entered_async_bridge._sync_client is None
 
-@pytest.mark.asyncio
-async def test_async_context_manager():
-    """Test async context manager."""
+
+async def test_async_context_manager_closes(mock_transport_async_client: httpx.AsyncClient):
+    """Test async context manager releases an injected async client on exit without closing it."""
+    async with NotifyBridge(async_client=mock_transport_async_client) as bridge:
+        assert bridge._async_client is mock_transport_async_client
+
+    assert bridge._async_client is None
+    assert not mock_transport_async_client.is_closed
+
+
+async def test_async_context_manager_closes_own_client():
+    """Test async context manager closes the async client it created on exit."""
     async with NotifyBridge() as bridge:
-        assert isinstance(bridge._async_client, httpx.AsyncClient)
-        assert bridge._sync_client is None
+        client = bridge._async_client
 
     assert bridge._async_client is None
+    assert client.is_closed
+
+
+async def test_send_async_uses_injected_client(mock_transport_async_client: httpx.AsyncClient):
+    """Test notifiers send through the async client injected into the bridge and leave it open."""
+    bridge = NotifyBridge(async_client=mock_transport_async_client)
+    response = await bridge.send_async("feishu", webhook_url="https://example.com", content="Test Content")
+    await bridge.close_async()
+
+    assert response.data == {"success": True}
+    assert not mock_transport_async_client.is_closed
 
 
 def test_get_notifier_class(mock_factory):
@@ -247,7 +188,6 @@ def test_create_notifier(mock_factory):
     assert notifier.name == "mock"
 
 
-@pytest.mark.asyncio
 async def test_create_async_notifier(mock_factory):
     """Test creating async notifier."""
     notifier = await mock_factory.create_notifier_async("mock")
@@ -255,11 +195,10 @@ async def test_create_async_notifier(mock_factory):
     assert notifier.name == "mock"
 
 
-def test_notify_validation_error(notify_bridge: NotifyBridge, test_notifier):
+def test_notify_validation_error(notify_bridge: NotifyBridge):
     """Test notification with invalid data."""
-    notify_bridge.register_notifier("mock", test_notifier)
     with pytest.raises(NotificationError):
-        notify_bridge.send("mock", data={"invalid": "data"})
+        notify_bridge.send("test", data={"invalid": "data"})
 
 
 def test_notify_notifier_not_found(notify_bridge: NotifyBridge):
@@ -268,7 +207,6 @@ def test_notify_notifier_not_found(notify_bridge: NotifyBridge):
         notify_bridge.send("non_existent", data={})
 
 
-@pytest.mark.asyncio
 async def test_notify_async_notifier_not_found(notify_bridge: NotifyBridge):
     """Test async notification with non-existent notifier."""
     with pytest.raises(NoSuchNotifierError):
@@ -285,8 +223,8 @@ def test_get_registered_notifiers(mock_factory):
 
 def test_register_notifier(notify_bridge: NotifyBridge, test_notifier):
     """Test registering a notifier."""
-    notify_bridge.register_notifier("test", test_notifier)
     assert notify_bridge.get_notifier_class("test") == test_notifier
+    assert "test" in notify_bridge.notifiers
 
 
 def test_get_notifier_not_found(notify_bridge: NotifyBridge):
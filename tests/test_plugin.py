@@ -1,61 +1,39 @@
 """Tests for plugin utilities."""
 
 # Import built-in modules
-from typing import Any, Dict, Type
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from typing import Type
 
 # Import third-party modules
 import pytest
 
 # Import local modules
-from notify_bridge.components import BaseNotifier, NotificationResponse
+from notify_bridge.components import BaseNotifier
 from notify_bridge.exceptions import PluginError
 from notify_bridge.plugin import get_notifiers_from_entry_points, load_notifier
-from notify_bridge.schema import NotificationSchema
 
+from tests.conftest import SharedTestNotifier
 
-@pytest.fixture
-def test_schema():
-    """Create a test schema class."""
-
-    class TestSchema(NotificationSchema):
-        """Test schema."""
-
-    return TestSchema
+_MOCK_ENTRY_POINT = SimpleNamespace(module="notify_bridge.notifiers.test", attr="TestNotifier", name="test")
+_MOCK_ENTRY_POINTS = SimpleNamespace(
+    # entry_points() behavior for Python 3.10+
+    select=lambda group: [_MOCK_ENTRY_POINT],
+    # entry_points() behavior for Python 3.9 and below
+    get=lambda group, default: [_MOCK_ENTRY_POINT],
+)
 
 
 @pytest.fixture
-def test_notifier():
-    """Create a test notifier class."""
-
-    class TestNotifier(BaseNotifier):
-        """Test notifier."""
-
-        name = "test"
-        schema = NotificationSchema
+def test_notifier() -> Type[BaseNotifier]:
+    """Provide the shared test notifier class."""
+    return SharedTestNotifier
 
-        def __init__(self, schema: Type[NotificationSchema], **kwargs: Any) -> None:
-            """Initialize the notifier.
 
-            Args:
-                schema: The schema class to use for validation.
-                **kwargs: Additional arguments to pass to the notifier.
-            """
-            super().__init__(schema=schema, **kwargs)
-
-        def notify(self, notification: Dict[str, Any], **kwargs: Any) -> NotificationResponse:
-            """Send data."""
-            return NotificationResponse(success=True, name=self.name)
-
-        async def anotify(self, notification: Dict[str, Any], **kwargs: Any) -> NotificationResponse:
-            """Send data asynchronously."""
-            return NotificationResponse(success=True, name=self.name)
-
-        def assemble_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-            """Build payload."""
-            return {}
-
-    return TestNotifier
+@pytest.fixture
+def mock_entry_points(monkeypatch: pytest.MonkeyPatch, test_notifier: Type[BaseNotifier]) -> None:
+    """Expose the test notifier through a single mocked entry point."""
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda: _MOCK_ENTRY_POINTS)
+    monkeypatch.setattr("notify_bridge.plugin.load_notifier", lambda entry_point: test_notifier)
 
 
 def test_load_notifier_multiple_colons():
@@ -82,34 +60,13 @@ def test_load_notifier_invalid_module():
         load_notifier("invalid.module:class")
 
 
-def test_get_notifiers_from_entry_points(test_notifier):
+def test_get_notifiers_from_entry_points(test_notifier, mock_entry_points):
     """Test getting notifiers from entry points."""
-    # Mock pkg_resources.iter_entry_points
-    with patch("importlib.metadata.entry_points") as mock_entry_points:
-        # Create a mock entry point
-        mock_entry_point = Mock()
-        mock_entry_point.module = "notify_bridge.notifiers.test"
-        mock_entry_point.attr = "TestNotifier"
-        mock_entry_point.name = "test"
-
-        # Mock entry_points() behavior for Python 3.10+
-        mock_select = Mock()
-        mock_select.return_value = [mock_entry_point]
-        mock_entry_points.return_value.select = mock_select
-
-        # Mock entry_points() behavior for Python 3.9 and below
-        mock_entry_points.return_value.get = Mock(return_value=[mock_entry_point])
-
-        # Mock load_notifier
-        with patch(
-            "notify_bridge.plugin.load_notifier",
-            return_value=test_notifier,
-        ):
-            # Test getting notifiers
-            notifiers = get_notifiers_from_entry_points()
-            assert len(notifiers) == 1
-            assert test_notifier.name.lower() in notifiers
-            assert notifiers[test_notifier.name.lower()] == test_notifier
+    # Test getting notifiers
+    notifiers = get_notifiers_from_entry_points()
+    assert len(notifiers) == 1
+    assert test_notifier.name.lower() in notifiers
+    assert notifiers[test_notifier.name.lower()] == test_notifier
 
 
 def test_load_plugins(tmp_path, monkeypatch):
@@ -155,7 +112,7 @@ class TestPlugin(BaseNotifier):
     assert plugins["test_plugin"].name == "test_plugin"
 
 
-def test_get_all_notifiers(tmp_path, monkeypatch, test_notifier):
+def test_get_all_notifiers(tmp_path, monkeypatch, test_notifier, mock_entry_points):
     """Test getting all notifiers."""
     # Create a temporary plugin file
     plugin_dir = tmp_path / "plugins"
@@ -188,37 +145,17 @@ class TestPlugin(BaseNotifier):
     # Add plugin directory to Python path
     monkeypatch.syspath_prepend(str(plugin_dir))
 
-    # Mock entry points
-    with patch("importlib.metadata.entry_points") as mock_entry_points:
-        mock_entry_point = Mock()
-        mock_entry_point.module = "notify_bridge.notifiers.test"
-        mock_entry_point.attr = "TestNotifier"
-        mock_entry_point.name = "test"
-
-        # Mock entry_points() behavior for Python 3.10+
-        mock_select = Mock()
-        mock_select.return_value = [mock_entry_point]
-        mock_entry_points.return_value.select = mock_select
-
-        # Mock entry_points() behavior for Python 3.9 and below
-        mock_entry_points.return_value.get = Mock(return_value=[mock_entry_point])
-
-        # Mock load_notifier
-        with patch(
-            "notify_bridge.plugin.load_notifier",
-            return_value=test_notifier,
-        ):
-            # Test getting all notifiers
-            # Import local modules
-            from notify_bridge.plugin import get_all_notifiers
-
-            notifiers = get_all_notifiers(str(plugin_dir))
-            assert len(notifiers) >= 2  # At least the test notifier and test plugin
-            assert test_notifier.name.lower() in notifiers
-            assert "test_plugin" in notifiers
-
-
-def test_get_notifier_class(tmp_path, monkeypatch, test_notifier):
+    # Test getting all notifiers
+    # Import local modules
+    from notify_bridge.plugin import get_all_notifiers
+
+    notifiers = get_all_notifiers(str(plugin_dir))
+    assert len(notifiers) >= 2  # At least the test notifier and test plugin
+    assert test_notifier.name.lower() in notifiers
+    assert "test_plugin" in notifiers
+
+
+def test_get_notifier_class(tmp_path, monkeypatch, test_notifier, mock_entry_points):
     """Test getting a notifier class by name."""
     # Create a temporary plugin file
     plugin_dir = tmp_path / "plugins"
@@ -251,41 +188,21 @@ class TestPlugin(BaseNotifier):
     # Add plugin directory to Python path
     monkeypatch.syspath_prepend(str(plugin_dir))
 
-    # Mock entry points
-    with patch("importlib.metadata.entry_points") as mock_entry_points:
-        mock_entry_point = Mock()
-        mock_entry_point.module = "notify_bridge.notifiers.test"
-        mock_entry_point.attr = "TestNotifier"
-        mock_entry_point.name = "test"
-
-        # Mock entry_points() behavior for Python 3.10+
-        mock_select = Mock()
-        mock_select.return_value = [mock_entry_point]
-        mock_entry_points.return_value.select = mock_select
-
-        # Mock entry_points() behavior for Python 3.9 and below
-        mock_entry_points.return_value.get = Mock(return_value=[mock_entry_point])
-
-        # Mock load_notifier
-        with patch(
-            "notify_bridge.plugin.load_notifier",
-            return_value=test_notifier,
-        ):
-            # Test getting notifier class
-            # Import local modules
-            from notify_bridge.plugin import get_notifier_class
+    # Test getting notifier class
+    # Import local modules
+    from notify_bridge.plugin import get_notifier_class
 
-            # Test getting existing notifier
-            notifier_class = get_notifier_class(test_notifier.name, str(plugin_dir))
-            assert notifier_class == test_notifier
+    # Test getting existing notifier
+    notifier_class = get_notifier_class(test_notifier.name, str(plugin_dir))
+    assert notifier_class == test_notifier
 
-            # Test getting plugin notifier
-            plugin_class = get_notifier_class("test_plugin", str(plugin_dir))
-            assert plugin_class.name == "test_plugin"
+    # Test getting plugin notifier
+    plugin_class = get_notifier_class("test_plugin", str(plugin_dir))
+    assert plugin_class.name == "test_plugin"
 
-            # Test getting non-existent notifier
-            with pytest.raises(PluginError):
-                get_notifier_class("non_existent", str(plugin_dir))
+    # Test getting non-existent notifier
+    with pytest.raises(PluginError):
+        get_notifier_class("non_existent", str(plugin_dir))
 
 
 def test_load_plugins_invalid_directory():
@@ -297,14 +214,19 @@ def test_load_plugins_invalid_directory():
     assert len(plugins) == 0
 
 
-def test_load_plugins_invalid_plugin():
+def test_load_plugins_invalid_plugin(monkeypatch: pytest.MonkeyPatch):
     """Test loading an invalid plugin."""
-    # Create a temporary plugin file with invalid code
-    with patch("os.path.exists", return_value=True), patch("os.listdir", return_value=["invalid_plugin.py"]), patch(
-        "importlib.import_module", side_effect=ImportError
-    ):
-        # Import local modules
-        from notify_bridge.plugin import load_plugins
-
-        plugins = load_plugins("/test/plugins")
-        assert len(plugins) == 0
+
+    def _raise_import_error(name: str) -> None:
+        raise ImportError(name)
+
+    # Pretend the directory holds one plugin that fails to import
+    monkeypatch.setattr("os.path.exists", lambda path: True)
+    monkeypatch.setattr("os.listdir", lambda path: ["invalid_plugin.py"])
+    monkeypatch.setattr("importlib.import_module", _raise_import_error)
+
+    # Import local modules
+    from notify_bridge.plugin import load_plugins
+
+    plugins = load_plugins("/test/plugins")
+    assert len(plugins) == 0
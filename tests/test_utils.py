@@ -1,15 +1,16 @@
 """Tests for utility functions and classes."""
 
-# Import built-in modules
-from unittest.mock import AsyncMock, patch
-
 # Import third-party modules
+import httpx
 import pytest
-import pytest_asyncio
 
 # Import local modules
 from notify_bridge.utils import AsyncHTTPClient, HTTPClient, HTTPClientConfig
 
+_URL = "https://example.com"
+_REQUEST_JSON = {"test": "data"}
+_EXPECTED_BODY = b'{"test":"data"}'
+
 
 def test_http_client_config():
     """Test HTTP client configuration."""
@@ -28,29 +29,60 @@ def test_http_client_config():
     assert config.headers == {"User-Agent": "test"}
 
 
-@pytest.fixture
-def http_client_config() -> HTTPClientConfig:
-    """Create HTTP client config fixture."""
-    return HTTPClientConfig(timeout=5, max_retries=3, retry_delay=0.1, verify_ssl=False, headers={"User-Agent": "Test"})
-
-
-@pytest.fixture
-def http_client(http_client_config: HTTPClientConfig) -> HTTPClient:
-    """Create HTTP client fixture."""
-    with patch("httpx.Client") as mock_client:
-        client = HTTPClient(http_client_config)
-        mock_client.return_value.__enter__.return_value = mock_client.return_value
-        with client as c:
-            yield c
-
-
-@pytest_asyncio.fixture
-async def async_http_client(http_client_config: HTTPClientConfig) -> AsyncHTTPClient:
-    """Create async HTTP client fixture."""
-    with patch("httpx.AsyncClient") as mock_client:
-        client = AsyncHTTPClient(http_client_config)
-        mock_client.return_value = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_client.return_value
-        mock_client.return_value.aclose = AsyncMock()
-        async with client as c:
-            yield c
+@pytest.fixture(scope="module")
+def http_client(http_client_config: HTTPClientConfig, mock_transport_client: httpx.Client) -> HTTPClient:
+    """Create HTTP client fixture backed by the mock transport client."""
+    return HTTPClient(http_client_config, client=mock_transport_client)
+
+
+@pytest.fixture(scope="module")
+def async_http_client(
+    http_client_config: HTTPClientConfig, mock_transport_async_client: httpx.AsyncClient
+) -> AsyncHTTPClient:
+    """Create async HTTP client fixture backed by the mock transport client."""
+    return AsyncHTTPClient(http_client_config, client=mock_transport_async_client)
+
+
+@pytest.mark.xdist_group("sync_http")
+def test_http_client_request(http_client: HTTPClient):
+    """Test HTTP client sends requests through the underlying client."""
+    response = http_client.request("post", _URL, json=_REQUEST_JSON)
+
+    assert response.json() == {"success": True}
+    assert response.request.method == "POST"
+    assert response.request.url == _URL
+    assert response.request.content == _EXPECTED_BODY
+
+
+@pytest.mark.xdist_group("async_http")
+async def test_async_http_client_request(async_http_client: AsyncHTTPClient):
+    """Test async HTTP client sends requests through the underlying client."""
+    response = await async_http_client.request("post", _URL, json=_REQUEST_JSON)
+
+    assert response.json() == {"success": True}
+    assert response.request.method == "POST"
+    assert response.request.url == _URL
+    assert response.request.content == _EXPECTED_BODY
+
+
+@pytest.mark.xdist_group("sync_http")
+def test_http_client_request_unsupported_method(http_client: HTTPClient):
+    """Test HTTP client rejects unsupported HTTP methods."""
+    with pytest.raises(ValueError, match="Unsupported HTTP method: INVALID"):
+        http_client.request("invalid", _URL)
+
+
+@pytest.mark.xdist_group("async_http")
+async def test_async_http_client_request_unsupported_method(async_http_client: AsyncHTTPClient):
+    """Test async HTTP client rejects unsupported HTTP methods."""
+    with pytest.raises(ValueError, match="Unsupported HTTP method: INVALID"):
+        await async_http_client.request("invalid", _URL)
+
+
+@pytest.mark.xdist_group("async_http")
+async def test_async_http_client_keeps_injected_client_open(async_http_client: AsyncHTTPClient):
+    """Test closing the async HTTP client leaves an injected client open."""
+    async with async_http_client:
+        pass
+
+    assert not async_http_client._client.is_closed